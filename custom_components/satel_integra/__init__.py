@@ -5,7 +5,7 @@ import logging
 from satel_integra_enh import AsyncSatel
 import voluptuous as vol
 
-from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigSubentry
 from homeassistant.const import (
     CONF_CODE,
     CONF_HOST,
@@ -20,6 +20,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, issue_registry as ir
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import RegistryEntry, async_migrate_entries
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -43,12 +44,16 @@ from .const import (
     SIGNAL_OUTPUTS_UPDATED,
     SIGNAL_PANEL_MESSAGE,
     SIGNAL_ZONES_UPDATED,
+    STORAGE_KEY_TEMPERATURE,
+    STORAGE_VERSION_TEMPERATURE,
     SUBENTRY_TYPE_OUTPUT,
     SUBENTRY_TYPE_PARTITION,
     SUBENTRY_TYPE_SWITCHABLE_OUTPUT,
     SUBENTRY_TYPE_ZONE,
     ZONES,
     SatelConfigEntry,
+    SatelIntegraData,
+    signal_device_updated,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -168,29 +173,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: SatelConfigEntry) -> boo
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
+    # Group subentries by type once, the platforms reuse this from runtime data
+    subentries_by_type: dict[str, list[ConfigSubentry]] = {}
+    for subentry in entry.subentries.values():
+        subentries_by_type.setdefault(subentry.subentry_type, []).append(subentry)
+
     # Make sure we initialize the Satel controller with the configured entries to monitor
     partitions = [
         subentry.data[CONF_PARTITION_NUMBER]
-        for subentry in entry.subentries.values()
-        if subentry.subentry_type == SUBENTRY_TYPE_PARTITION
+        for subentry in subentries_by_type.get(SUBENTRY_TYPE_PARTITION, [])
     ]
 
     zones = [
         subentry.data[CONF_ZONE_NUMBER]
-        for subentry in entry.subentries.values()
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE
+        for subentry in subentries_by_type.get(SUBENTRY_TYPE_ZONE, [])
     ]
 
     outputs = [
         subentry.data[CONF_OUTPUT_NUMBER]
-        for subentry in entry.subentries.values()
-        if subentry.subentry_type == SUBENTRY_TYPE_OUTPUT
+        for subentry in subentries_by_type.get(SUBENTRY_TYPE_OUTPUT, [])
     ]
 
     switchable_outputs = [
         subentry.data[CONF_SWITCHABLE_OUTPUT_NUMBER]
-        for subentry in entry.subentries.values()
-        if subentry.subentry_type == SUBENTRY_TYPE_SWITCHABLE_OUTPUT
+        for subentry in subentries_by_type.get(SUBENTRY_TYPE_SWITCHABLE_OUTPUT, [])
     ]
 
     monitored_outputs = outputs + switchable_outputs
@@ -217,7 +223,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SatelConfigEntry) -> boo
         integration_key=integration_key,
     )
 
-    entry.runtime_data = controller
+    entry.runtime_data = SatelIntegraData(controller, subentries_by_type)
 
     async def _close(*_):
         await controller.close()
@@ -234,17 +240,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: SatelConfigEntry) -> boo
         _LOGGER.debug("Sending request to update panel state")
         async_dispatcher_send(hass, SIGNAL_PANEL_MESSAGE)
 
+    # Every reported device is dispatched on its own signal, entities skip the
+    # state write when nothing changed. This also corrects optimistic switch states.
     @callback
     def zones_update_callback(status):
         """Update zone objects as per notification from the alarm."""
         _LOGGER.debug("Zones callback, status: %s", status)
-        async_dispatcher_send(hass, SIGNAL_ZONES_UPDATED, status)
+        for zone_number, state in status.items():
+            async_dispatcher_send(
+                hass,
+                signal_device_updated(SIGNAL_ZONES_UPDATED, entry.entry_id, zone_number),
+                state,
+            )
 
     @callback
     def outputs_update_callback(status):
         """Update zone objects as per notification from the alarm."""
         _LOGGER.debug("Outputs updated callback , status: %s", status)
-        async_dispatcher_send(hass, SIGNAL_OUTPUTS_UPDATED, status)
+        for output_number, state in status.items():
+            async_dispatcher_send(
+                hass,
+                signal_device_updated(
+                    SIGNAL_OUTPUTS_UPDATED, entry.entry_id, output_number
+                ),
+                state,
+            )
 
     controller.register_callbacks(
         alarm_status_callback=alarm_status_update_callback,
@@ -261,12 +281,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: SatelConfigEntry) -> bo
     """Unloading the Satel platforms."""
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        controller = entry.runtime_data
-        await controller.close()
+        await entry.runtime_data.controller.close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: SatelConfigEntry) -> None:
+    """Remove stored temperature detection results of a deleted entry."""
+    store: Store[dict[str, list[int]]] = Store(
+        hass,
+        STORAGE_VERSION_TEMPERATURE,
+        STORAGE_KEY_TEMPERATURE.format(entry_id=entry.entry_id),
+    )
+    await store.async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: SatelConfigEntry) -> None:
     """Handle options update."""
     hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -25,7 +25,7 @@ from .const import (
     SUBENTRY_TYPE_PARTITION,
     SatelConfigEntry,
 )
-from .entity import SatelIntegraEntity
+from .entity import ENTITY_TYPE_ALARM_PANEL, SatelIntegraEntity
 
 ALARM_STATE_MAP = {
     AlarmState.TRIGGERED: AlarmControlPanelState.TRIGGERED,
@@ -49,11 +49,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up for Satel Integra alarm panels."""
 
-    controller = config_entry.runtime_data
+    controller = config_entry.runtime_data.controller
 
-    partition_subentries = filter(
-        lambda entry: entry.subentry_type == SUBENTRY_TYPE_PARTITION,
-        config_entry.subentries.values(),
+    partition_subentries = config_entry.runtime_data.subentries_by_type.get(
+        SUBENTRY_TYPE_PARTITION, []
     )
 
     for subentry in partition_subentries:
@@ -97,6 +96,7 @@ class SatelIntegraAlarmPanel(SatelIntegraEntity, AlarmControlPanelEntity):
             config_entry_id,
             subentry,
             device_number,
+            ENTITY_TYPE_ALARM_PANEL,
         )
 
         self._arm_home_mode = arm_home_mode
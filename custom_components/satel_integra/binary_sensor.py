@@ -24,8 +24,9 @@ from .const import (
     SUBENTRY_TYPE_OUTPUT,
     SUBENTRY_TYPE_ZONE,
     SatelConfigEntry,
+    signal_device_updated,
 )
-from .entity import SatelIntegraEntity
+from .entity import ENTITY_TYPE_OUTPUTS, ENTITY_TYPE_ZONES, SatelIntegraEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,53 +38,42 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Satel Integra binary sensor devices."""
 
-    controller = config_entry.runtime_data
-
-    zone_subentries = filter(
-        lambda entry: entry.subentry_type == SUBENTRY_TYPE_ZONE,
-        config_entry.subentries.values(),
-    )
-
-    for subentry in zone_subentries:
-        zone_num: int = subentry.data[CONF_ZONE_NUMBER]
-        zone_type: BinarySensorDeviceClass = subentry.data[CONF_ZONE_TYPE]
-
-        async_add_entities(
-            [
-                SatelIntegraBinarySensor(
-                    controller,
-                    config_entry.entry_id,
-                    subentry,
-                    zone_num,
-                    zone_type,
-                    SIGNAL_ZONES_UPDATED,
-                )
-            ],
-            config_subentry_id=subentry.subentry_id,
-        )
-
-    output_subentries = filter(
-        lambda entry: entry.subentry_type == SUBENTRY_TYPE_OUTPUT,
-        config_entry.subentries.values(),
-    )
-
-    for subentry in output_subentries:
-        output_num: int = subentry.data[CONF_OUTPUT_NUMBER]
-        ouput_type: BinarySensorDeviceClass = subentry.data[CONF_ZONE_TYPE]
-
-        async_add_entities(
-            [
-                SatelIntegraBinarySensor(
-                    controller,
-                    config_entry.entry_id,
-                    subentry,
-                    output_num,
-                    ouput_type,
-                    SIGNAL_OUTPUTS_UPDATED,
-                )
-            ],
-            config_subentry_id=subentry.subentry_id,
-        )
+    controller = config_entry.runtime_data.controller
+    subentries_by_type = config_entry.runtime_data.subentries_by_type
+
+    # Zones and outputs only differ in the number key, entity type and signal
+    for subentry_type, number_key, entity_type, react_to_signal in (
+        (
+            SUBENTRY_TYPE_ZONE,
+            CONF_ZONE_NUMBER,
+            ENTITY_TYPE_ZONES,
+            SIGNAL_ZONES_UPDATED,
+        ),
+        (
+            SUBENTRY_TYPE_OUTPUT,
+            CONF_OUTPUT_NUMBER,
+            ENTITY_TYPE_OUTPUTS,
+            SIGNAL_OUTPUTS_UPDATED,
+        ),
+    ):
+        for subentry in subentries_by_type.get(subentry_type, []):
+            device_number: int = subentry.data[number_key]
+            device_class: BinarySensorDeviceClass = subentry.data[CONF_ZONE_TYPE]
+
+            async_add_entities(
+                [
+                    SatelIntegraBinarySensor(
+                        controller,
+                        config_entry.entry_id,
+                        subentry,
+                        device_number,
+                        entity_type,
+                        device_class,
+                        react_to_signal,
+                    )
+                ],
+                config_subentry_id=subentry.subentry_id,
+            )
 
 
 class SatelIntegraBinarySensor(SatelIntegraEntity, BinarySensorEntity):
@@ -95,6 +85,7 @@ class SatelIntegraBinarySensor(SatelIntegraEntity, BinarySensorEntity):
         config_entry_id: str,
         subentry: ConfigSubentry,
         device_number: int,
+        entity_type: str,
         device_class: BinarySensorDeviceClass,
         react_to_signal: str,
     ) -> None:
@@ -104,6 +95,7 @@ class SatelIntegraBinarySensor(SatelIntegraEntity, BinarySensorEntity):
             config_entry_id,
             subentry,
             device_number,
+            entity_type,
         )
 
         self._attr_device_class = device_class
@@ -121,15 +113,18 @@ class SatelIntegraBinarySensor(SatelIntegraEntity, BinarySensorEntity):
 
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, self._react_to_signal, self._devices_updated
+                self.hass,
+                signal_device_updated(
+                    self._react_to_signal, self._config_entry_id, self._device_number
+                ),
+                self._devices_updated,
             )
         )
 
     @callback
-    def _devices_updated(self, zones: dict[int, int]):
+    def _devices_updated(self, state: int):
         """Update the zone's state, if needed."""
-        if self._device_number in zones:
-            new_state = zones[self._device_number] == 1
-            if new_state != self._attr_is_on:
-                self._attr_is_on = new_state
-                self.async_write_ha_state()
+        new_state = state == 1
+        if new_state != self._attr_is_on:
+            self._attr_is_on = new_state
+            self.async_write_ha_state()
@@ -1,8 +1,10 @@
 """Constants for the Satel Integra integration."""
 
+from dataclasses import dataclass
+
 from satel_integra_enh import AsyncSatel
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 
 DEFAULT_CONF_ARM_HOME_MODE = 1
 DEFAULT_PORT = 7094
@@ -32,9 +34,34 @@ CONF_SWITCHABLE_OUTPUTS = "switchable_outputs"
 
 ZONES = "zones"
 
+STORAGE_VERSION_TEMPERATURE = 1
+STORAGE_KEY_TEMPERATURE = "satel_integra.{entry_id}.temperature"
+
 SIGNAL_PANEL_MESSAGE = "satel_integra.panel_message"
 
+# Zone, output and temperature updates are dispatched per device, see
+# signal_device_updated
 SIGNAL_ZONES_UPDATED = "satel_integra.zones_updated"
 SIGNAL_OUTPUTS_UPDATED = "satel_integra.outputs_updated"
+SIGNAL_TEMPERATURE_UPDATED = "satel_integra.temperature_updated"
+
+
+def signal_device_updated(signal: str, entry_id: str, number: int) -> str:
+    """Return the dispatcher signal for a single zone or output of a config entry.
+
+    The payload is the new state (1 = violated/on) for SIGNAL_ZONES_UPDATED and
+    SIGNAL_OUTPUTS_UPDATED, and the temperature in °C for SIGNAL_TEMPERATURE_UPDATED.
+    """
+    return f"{signal}_{entry_id}_{number}"
+
+
+@dataclass
+class SatelIntegraData:
+    """Runtime data of a Satel Integra config entry."""
+
+    controller: AsyncSatel
+    # Subentries grouped by subentry type, built once in a single pass at setup
+    subentries_by_type: dict[str, list[ConfigSubentry]]
+
 
-type SatelConfigEntry = ConfigEntry[AsyncSatel]
+type SatelConfigEntry = ConfigEntry[SatelIntegraData]
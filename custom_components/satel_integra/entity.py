@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
 
 from satel_integra_enh import AsyncSatel
 
@@ -14,23 +13,14 @@ from homeassistant.helpers import area_registry as ar, device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 
-from .const import (
-    CONF_AREA,
-    DOMAIN,
-    SUBENTRY_TYPE_OUTPUT,
-    SUBENTRY_TYPE_PARTITION,
-    SUBENTRY_TYPE_SWITCHABLE_OUTPUT,
-    SUBENTRY_TYPE_ZONE,
-)
+from .const import CONF_AREA, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-SubentryTypeToEntityType: dict[str, str] = {
-    SUBENTRY_TYPE_PARTITION: "alarm_panel",
-    SUBENTRY_TYPE_SWITCHABLE_OUTPUT: "switch",
-    SUBENTRY_TYPE_ZONE: "zones",
-    SUBENTRY_TYPE_OUTPUT: "outputs",
-}
+ENTITY_TYPE_ALARM_PANEL = "alarm_panel"
+ENTITY_TYPE_SWITCH = "switch"
+ENTITY_TYPE_ZONES = "zones"
+ENTITY_TYPE_OUTPUTS = "outputs"
 
 
 class SatelIntegraEntity(Entity):
@@ -46,18 +36,19 @@ class SatelIntegraEntity(Entity):
         config_entry_id: str,
         subentry: ConfigSubentry,
         device_number: int,
+        entity_type: str,
     ) -> None:
-        """Initialize the Satel Integra entity."""
+        """Initialize the Satel Integra entity.
+
+        entity_type is one of the ENTITY_TYPE_* constants matching the subentry
+        type, passed in by the platform so no lookup is needed per entity.
+        """
 
         self._satel = controller
+        self._config_entry_id = config_entry_id
         self._device_number = device_number
         self._subentry = subentry  # Store for area assignment later
 
-        entity_type = SubentryTypeToEntityType[subentry.subentry_type]
-
-        if TYPE_CHECKING:
-            assert entity_type is not None
-
         self._attr_unique_id = f"{config_entry_id}_{entity_type}_{device_number}"
 
         # Build device info without suggested_area to prevent auto-creation of areas
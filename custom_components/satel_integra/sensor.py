@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import zlib
+from datetime import datetime, timedelta
 
 from satel_integra_enh import AsyncSatel
 
@@ -15,32 +16,55 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigSubentry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_ENABLE_TEMPERATURE,
     CONF_ZONE_NUMBER,
+    SIGNAL_TEMPERATURE_UPDATED,
+    STORAGE_KEY_TEMPERATURE,
+    STORAGE_VERSION_TEMPERATURE,
     SUBENTRY_TYPE_ZONE,
     SatelConfigEntry,
+    signal_device_updated,
 )
-from .entity import SatelIntegraEntity
+from .entity import ENTITY_TYPE_ZONES, SatelIntegraEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 # Temperature polling interval - 5 minutes to avoid overwhelming the connection
 TEMPERATURE_SCAN_INTERVAL = timedelta(minutes=5)
 
+# Delay before the first poll cycle to allow the system to stabilize
+TEMPERATURE_FIRST_POLL_DELAY = 20
+
+# Upper bound of the per config entry offset added to the first poll delay
+TEMPERATURE_FIRST_POLL_OFFSET = 30
+
 # Delay between sequential temperature requests (10 seconds)
 TEMPERATURE_REQUEST_DELAY = 10
 
+# Consecutive poll cycles a zone must answer without temperature before it is
+# remembered as unsupported, a single missing answer may be transient
+TEMPERATURE_NO_RESPONSE_LIMIT = 2
+
+# Upper bound for a single temperature request to the panel
+TEMPERATURE_REQUEST_TIMEOUT = 6
+
 # Maximum time to wait for connection recovery (2 minutes)
 CONNECTION_RECOVERY_TIMEOUT = 120
 
 
 async def _verify_and_recover_connection(
     hass: HomeAssistant,
-    config_entry,
+    config_entry: SatelConfigEntry,
     satel: AsyncSatel,
     zone_number: int
 ) -> bool:
@@ -114,130 +138,250 @@ async def _verify_and_recover_connection(
         return False
 
 
-async def _temperature_polling_task(
-    hass: HomeAssistant,
-    config_entry,
-    temperature_sensors: list[SatelIntegraTemperatureSensor],
-) -> None:
-    """Background task to sequentially poll temperature from configured zones.
+class SatelTemperatureCoordinator:
+    """Poll zone temperatures sequentially and dispatch the readings.
 
-    This task runs independently of HA's polling mechanism to avoid blocking.
-    Requests are sent sequentially with 10-second delays to prevent overwhelming
-    the alarm panel connection. Only zones with enable_temperature=True are polled.
+    Poll cycles are scheduled with HA's time tracking helpers every
+    TEMPERATURE_SCAN_INTERVAL, so no task is parked between cycles. A cycle
+    requests the zones one at a time, TEMPERATURE_REQUEST_DELAY apart, and
+    readings are pushed to the sensors via the per entry and zone
+    SIGNAL_TEMPERATURE_UPDATED signal. Requests are not spread over the whole
+    interval, every cycle (including the first) is a short burst followed by
+    idle time until the next one.
     """
-    _LOGGER.info("Temperature polling task started for %d zones", len(temperature_sensors))
 
-    # Wait 20 seconds before first poll to allow system to stabilize
-    first_poll = True
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SatelConfigEntry,
+        controller: AsyncSatel,
+        zones: list[int],
+        store: Store[dict[str, list[int]]],
+        unsupported_zones: list[int],
+    ) -> None:
+        """Initialize the temperature coordinator."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._satel = controller
+        self._zones = zones
+        self._store = store
+        self._unsupported_zones = unsupported_zones
+        self._task: asyncio.Task | None = None
+        self._unsub_timers: list[CALLBACK_TYPE] = []
+        # Consecutive cycles each zone answered without temperature
+        self._no_response_counts: dict[int, int] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first poll cycle."""
+        # Wait before first poll to allow system to stabilize. The offset keeps
+        # several panels from polling in lockstep and is stable across restarts
+        # (crc32 instead of hash(), which is salted per process for strings).
+        delay = TEMPERATURE_FIRST_POLL_DELAY + (
+            zlib.crc32(self._config_entry.entry_id.encode()) % TEMPERATURE_FIRST_POLL_OFFSET
+        )
+        _LOGGER.debug(
+            "Temperature polling for %d zones starts in %d seconds",
+            len(self._zones),
+            delay,
+        )
+        self._unsub_timers.append(
+            async_call_later(self._hass, delay, self._async_start_polling)
+        )
 
-    while True:
-        try:
-            if first_poll:
-                _LOGGER.debug("Waiting 20 seconds before first temperature poll")
-                await asyncio.sleep(20)
-                first_poll = False
-            else:
-                # Wait full interval between subsequent polls
-                await asyncio.sleep(TEMPERATURE_SCAN_INTERVAL.total_seconds())
-
-            _LOGGER.debug("Starting temperature polling cycle for %d zones", len(temperature_sensors))
-
-            for sensor in temperature_sensors:
-                # Skip sensors that have been disabled (no temperature support)
-                if not sensor._temperature_enabled:
-                    continue
-
-                # Check if connection is healthy before requesting
-                if not sensor._satel.connected:
-                    _LOGGER.warning(
-                        "Connection lost during temperature polling - attempting recovery"
-                    )
-                    # Attempt to recover connection
-                    if await _verify_and_recover_connection(hass, config_entry, sensor._satel, sensor._zone_number):
-                        _LOGGER.info("Connection recovered - continuing temperature polling")
-                    else:
-                        _LOGGER.info("Config entry reload triggered - temperature polling will restart after reload")
-                        break
+    @callback
+    def async_stop(self) -> None:
+        """Cancel scheduled poll cycles and the running one."""
+        self._async_cancel_timers()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_request_temperature(self, zone_number: int) -> float | None:
+        """Request the zone temperature from the panel.
+
+        Requests are bounded by TEMPERATURE_REQUEST_TIMEOUT. On timeout or
+        unload the request is cancelled rather than left running, so it can
+        never overlap the next zone's request or outlive the controller.
+        """
+        return await asyncio.wait_for(
+            self._satel.get_zone_temperature(zone_number),
+            timeout=TEMPERATURE_REQUEST_TIMEOUT,
+        )
 
-                try:
-                    _LOGGER.debug(
-                        "Requesting temperature for zone %s ('%s')",
-                        sensor._zone_number,
-                        sensor.name,
-                    )
+    @callback
+    def _disable_zone(self, zone_number: int, persist: bool = False) -> None:
+        """Stop polling a zone that does not report temperature.
+
+        With persist=True the zone is remembered across restarts, so it is not
+        probed again until temperature is re-enabled for it.
+        """
+        if zone_number in self._zones:
+            self._zones.remove(zone_number)
+
+        if persist and zone_number not in self._unsupported_zones:
+            self._unsupported_zones.append(zone_number)
+            self._store.async_delay_save(self._data_to_store)
+
+    @callback
+    def _data_to_store(self) -> dict[str, list[int]]:
+        """Return the temperature detection results to persist."""
+        return {"unsupported_zones": self._unsupported_zones}
+
+    @callback
+    def _async_start_polling(self, now: datetime) -> None:
+        """Run the first poll cycle and schedule the following ones."""
+        self._unsub_timers.append(
+            async_track_time_interval(
+                self._hass,
+                self._async_schedule_cycle,
+                TEMPERATURE_SCAN_INTERVAL,
+                cancel_on_shutdown=True,
+            )
+        )
+        self._async_schedule_cycle(now)
 
-                    # Request temperature (blocks for up to 5 seconds)
-                    temperature = await sensor._satel.get_zone_temperature(sensor._zone_number)
+    @callback
+    def _async_cancel_timers(self) -> None:
+        """Cancel scheduled poll cycles."""
+        while self._unsub_timers:
+            self._unsub_timers.pop()()
 
-                    if temperature is not None:
-                        _LOGGER.debug(
-                            "Zone %s ('%s') temperature: %.1f°C",
-                            sensor._zone_number,
-                            sensor.name,
-                            temperature,
-                        )
-                        sensor._attr_native_value = temperature
-                        sensor.async_write_ha_state()
-                    else:
-                        # Zone doesn't support temperature - disable future polling
-                        _LOGGER.info(
-                            "Zone %s ('%s') does not support temperature - disabling",
-                            sensor._zone_number,
-                            sensor.name,
-                        )
-                        sensor._temperature_enabled = False
-                        # Give connection extra time to recover after no-response
-                        await asyncio.sleep(5)
-
-                except asyncio.TimeoutError:
-                    _LOGGER.warning(
-                        "Timeout reading temperature for zone %s - may not support temperature",
-                        sensor._zone_number,
-                    )
-                    # Disable polling for this sensor
-                    sensor._temperature_enabled = False
+    @callback
+    def _async_schedule_cycle(self, now: datetime) -> None:
+        """Start a poll cycle unless the previous one is still running."""
+        if not self._zones:
+            _LOGGER.info("No zones with temperature support left - stopping temperature polling")
+            self._async_cancel_timers()
+            return
 
-                    # Verify connection health and attempt recovery if needed
-                    _LOGGER.info("Verifying connection health after timeout...")
-                    if await _verify_and_recover_connection(hass, config_entry, sensor._satel, sensor._zone_number):
-                        _LOGGER.info("Connection verified/recovered - continuing with next zone")
-                    else:
-                        _LOGGER.info(
-                            "Config entry reload triggered after zone %s timeout - temperature polling will restart after reload",
-                            sensor._zone_number
-                        )
-                        break
+        if self._task is not None and not self._task.done():
+            _LOGGER.debug("Previous temperature polling cycle still running - skipping")
+            return
 
-                except Exception as ex:
-                    _LOGGER.warning(
-                        "Error reading temperature for zone %s: %s",
-                        sensor._zone_number,
-                        ex,
-                    )
+        self._task = asyncio.create_task(self._run())
 
-                    # Verify connection health and attempt recovery if needed
-                    _LOGGER.info("Verifying connection health after error...")
-                    if await _verify_and_recover_connection(hass, config_entry, sensor._satel, sensor._zone_number):
-                        _LOGGER.info("Connection verified/recovered - continuing with next zone")
-                    else:
-                        _LOGGER.info(
-                            "Config entry reload triggered after zone %s error - temperature polling will restart after reload",
-                            sensor._zone_number
-                        )
-                        break
+    async def _run(self) -> None:
+        """Poll the configured zones one at a time."""
+        _LOGGER.debug("Starting temperature polling cycle for %d zones", len(self._zones))
 
-                # Wait before next request to avoid overwhelming connection
-                await asyncio.sleep(TEMPERATURE_REQUEST_DELAY)
+        try:
+            if not await self._async_poll_cycle():
+                _LOGGER.info("Config entry reload triggered - temperature polling will restart after reload")
+                self._async_cancel_timers()
+                return
 
             _LOGGER.debug("Temperature polling cycle completed")
 
         except asyncio.CancelledError:
             _LOGGER.info("Temperature polling task cancelled")
-            break
+            raise
         except Exception as ex:
+            # Continue despite errors, the next cycle is already scheduled
             _LOGGER.exception("Unexpected error in temperature polling task: %s", ex)
-            # Continue despite errors
-            await asyncio.sleep(60)
+
+    async def _async_poll_cycle(self) -> bool:
+        """Request temperature from every polled zone once.
+
+        Requests are TEMPERATURE_REQUEST_DELAY apart and each reading is
+        dispatched as soon as it arrives.
+
+        Returns False if a config entry reload was triggered and polling must stop.
+        """
+
+        # Iterate over a copy, unsupported zones are removed while polling
+        for zone_number in list(self._zones):
+            # Check if connection is healthy before requesting
+            if not self._satel.connected:
+                _LOGGER.warning(
+                    "Connection lost during temperature polling - attempting recovery"
+                )
+                # Attempt to recover connection
+                if not await _verify_and_recover_connection(self._hass, self._config_entry, self._satel, zone_number):
+                    return False
+                _LOGGER.info("Connection recovered - continuing temperature polling")
+
+            try:
+                _LOGGER.debug("Requesting temperature for zone %s", zone_number)
+
+                # Request temperature (blocks for up to TEMPERATURE_REQUEST_TIMEOUT seconds)
+                temperature = await self._async_request_temperature(zone_number)
+
+                if temperature is not None:
+                    _LOGGER.debug(
+                        "Zone %s temperature: %.1f°C", zone_number, temperature
+                    )
+                    self._no_response_counts.pop(zone_number, None)
+                    async_dispatcher_send(
+                        self._hass,
+                        signal_device_updated(
+                            SIGNAL_TEMPERATURE_UPDATED,
+                            self._config_entry.entry_id,
+                            zone_number,
+                        ),
+                        temperature,
+                    )
+                else:
+                    no_responses = self._no_response_counts.get(zone_number, 0) + 1
+                    self._no_response_counts[zone_number] = no_responses
+
+                    if no_responses >= TEMPERATURE_NO_RESPONSE_LIMIT:
+                        # Zone doesn't support temperature - disable future polling
+                        _LOGGER.info(
+                            "Zone %s does not support temperature - disabling", zone_number
+                        )
+                        self._disable_zone(zone_number, persist=True)
+                    else:
+                        _LOGGER.info(
+                            "Zone %s reported no temperature - retrying next cycle",
+                            zone_number,
+                        )
+                    # Give connection extra time to recover after no-response
+                    await asyncio.sleep(5)
+
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Timeout reading temperature for zone %s - may not support temperature",
+                    zone_number,
+                )
+                # Disable polling for this zone
+                self._disable_zone(zone_number)
+
+                # Verify connection health and attempt recovery if needed
+                _LOGGER.info("Verifying connection health after timeout...")
+                if not await _verify_and_recover_connection(self._hass, self._config_entry, self._satel, zone_number):
+                    return False
+                _LOGGER.info("Connection verified/recovered - continuing with next zone")
+
+            except (OSError, asyncio.IncompleteReadError) as ex:
+                # Connection level errors, these go through connection recovery
+                _LOGGER.warning(
+                    "Error reading temperature for zone %s: %s",
+                    zone_number,
+                    ex,
+                )
+
+                # Verify connection health and attempt recovery if needed
+                _LOGGER.info("Verifying connection health after error...")
+                if not await _verify_and_recover_connection(self._hass, self._config_entry, self._satel, zone_number):
+                    return False
+                _LOGGER.info("Connection verified/recovered - continuing with next zone")
+
+            except Exception:
+                # Anything else (e.g. a malformed response) only affects this zone.
+                # Log the traceback once and stop polling the zone until the next
+                # reload instead of repeating it every cycle; no connection recovery
+                _LOGGER.exception(
+                    "Unexpected error reading temperature for zone %s - disabling",
+                    zone_number,
+                )
+                self._disable_zone(zone_number)
+
+            # Wait before next request to avoid overwhelming connection
+            await asyncio.sleep(TEMPERATURE_REQUEST_DELAY)
+
+        return True
 
 
 async def async_setup_entry(
@@ -247,43 +391,70 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Satel Integra temperature sensor devices."""
 
-    controller = config_entry.runtime_data
+    controller = config_entry.runtime_data.controller
 
-    # Collect temperature sensor entities for zones with enable_temperature=True
-    temperature_sensors: list[SatelIntegraTemperatureSensor] = []
-
-    zone_subentries = filter(
-        lambda entry: entry.subentry_type == SUBENTRY_TYPE_ZONE,
-        config_entry.subentries.values(),
+    # Only create temperature sensors for zones with enable_temperature=True
+    temperature_subentries = [
+        subentry
+        for subentry in config_entry.runtime_data.subentries_by_type.get(
+            SUBENTRY_TYPE_ZONE, []
+        )
+        if subentry.data.get(CONF_ENABLE_TEMPERATURE, False)
+    ]
+    temperature_zones: list[int] = [
+        subentry.data[CONF_ZONE_NUMBER] for subentry in temperature_subentries
+    ]
+
+    # Zones found without temperature support on a previous start are not probed again
+    store: Store[dict[str, list[int]]] = Store(
+        hass,
+        STORAGE_VERSION_TEMPERATURE,
+        STORAGE_KEY_TEMPERATURE.format(entry_id=config_entry.entry_id),
     )
+    stored_zones = (await store.async_load() or {}).get("unsupported_zones", [])
 
-    for subentry in zone_subentries:
-        # Only create temperature sensors for zones with enable_temperature=True
-        if not subentry.data.get(CONF_ENABLE_TEMPERATURE, False):
-            continue
+    # Forget zones that no longer have temperature enabled, re-enabling triggers a new detection
+    unsupported_zones = [zone for zone in stored_zones if zone in temperature_zones]
+    if len(unsupported_zones) != len(stored_zones):
+        await store.async_save({"unsupported_zones": unsupported_zones})
 
-        zone_num: int = subentry.data[CONF_ZONE_NUMBER]
+    if unsupported_zones:
+        _LOGGER.debug(
+            "Skipping temperature polling for zones without temperature support: %s",
+            unsupported_zones,
+        )
 
-        sensor = SatelIntegraTemperatureSensor(
-            controller,
-            config_entry.entry_id,
-            subentry,
-            zone_num,
+    polled_zones = [zone for zone in temperature_zones if zone not in unsupported_zones]
+
+    coordinator: SatelTemperatureCoordinator | None = None
+    if polled_zones:
+        coordinator = SatelTemperatureCoordinator(
+            hass, config_entry, controller, polled_zones, store, unsupported_zones
         )
-        temperature_sensors.append(sensor)
+
+    for subentry in temperature_subentries:
+        zone_num: int = subentry.data[CONF_ZONE_NUMBER]
 
         async_add_entities(
-            [sensor],
+            [
+                SatelIntegraTemperatureSensor(
+                    controller,
+                    config_entry.entry_id,
+                    subentry,
+                    zone_num,
+                )
+            ],
             config_subentry_id=subentry.subentry_id,
         )
 
     # Start background task for sequential temperature polling
-    if temperature_sensors:
+    if coordinator is not None:
         _LOGGER.info(
             "Starting background temperature polling for %d temperature sensors",
-            len(temperature_sensors)
+            len(polled_zones)
         )
-        asyncio.create_task(_temperature_polling_task(hass, config_entry, temperature_sensors))
+        config_entry.async_on_unload(coordinator.async_stop)
+        coordinator.async_start()
 
 
 class SatelIntegraTemperatureSensor(SatelIntegraEntity, SensorEntity):
@@ -293,7 +464,6 @@ class SatelIntegraTemperatureSensor(SatelIntegraEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_suggested_display_precision = 1
-    _attr_should_poll = False  # Updated by background task, not HA polling
 
     def __init__(
         self,
@@ -308,6 +478,7 @@ class SatelIntegraTemperatureSensor(SatelIntegraEntity, SensorEntity):
             config_entry_id,
             subentry,
             zone_number,
+            ENTITY_TYPE_ZONES,
         )
 
         # Override unique_id to include _temperature suffix
@@ -319,6 +490,23 @@ class SatelIntegraTemperatureSensor(SatelIntegraEntity, SensorEntity):
         self._zone_number = zone_number
         self._attr_native_value: float | None = None
 
-        # Temperature polling is enabled by default (zone was configured with enable_temperature=True)
-        # Background task will disable if zone doesn't respond with temperature
-        self._temperature_enabled = True
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        # Call parent to handle area assignment
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_device_updated(
+                    SIGNAL_TEMPERATURE_UPDATED, self._config_entry_id, self._zone_number
+                ),
+                self._temperature_updated,
+            )
+        )
+
+    @callback
+    def _temperature_updated(self, temperature: float) -> None:
+        """Update the sensor with a reading dispatched by the coordinator."""
+        self._attr_native_value = temperature
+        self.async_write_ha_state()
@@ -18,8 +18,9 @@ from .const import (
     SIGNAL_OUTPUTS_UPDATED,
     SUBENTRY_TYPE_SWITCHABLE_OUTPUT,
     SatelConfigEntry,
+    signal_device_updated,
 )
-from .entity import SatelIntegraEntity
+from .entity import ENTITY_TYPE_SWITCH, SatelIntegraEntity
 
 
 async def async_setup_entry(
@@ -29,11 +30,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Satel Integra switch devices."""
 
-    controller = config_entry.runtime_data
+    controller = config_entry.runtime_data.controller
 
-    switchable_output_subentries = filter(
-        lambda entry: entry.subentry_type == SUBENTRY_TYPE_SWITCHABLE_OUTPUT,
-        config_entry.subentries.values(),
+    switchable_output_subentries = config_entry.runtime_data.subentries_by_type.get(
+        SUBENTRY_TYPE_SWITCHABLE_OUTPUT, []
     )
 
     for subentry in switchable_output_subentries:
@@ -70,6 +70,7 @@ class SatelIntegraSwitch(SatelIntegraEntity, SwitchEntity):
             config_entry_id,
             subentry,
             device_number,
+            ENTITY_TYPE_SWITCH,
         )
 
         self._code = code
@@ -83,18 +84,21 @@ class SatelIntegraSwitch(SatelIntegraEntity, SwitchEntity):
 
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, SIGNAL_OUTPUTS_UPDATED, self._devices_updated
+                self.hass,
+                signal_device_updated(
+                    SIGNAL_OUTPUTS_UPDATED, self._config_entry_id, self._device_number
+                ),
+                self._devices_updated,
             )
         )
 
     @callback
-    def _devices_updated(self, outputs: dict[int, int]) -> None:
+    def _devices_updated(self, state: int) -> None:
         """Update switch state, if needed."""
-        if self._device_number in outputs:
-            new_state = outputs[self._device_number] == 1
-            if new_state != self._attr_is_on:
-                self._attr_is_on = new_state
-                self.async_write_ha_state()
+        new_state = state == 1
+        if new_state != self._attr_is_on:
+            self._attr_is_on = new_state
+            self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""